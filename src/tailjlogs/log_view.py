@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-import base64
+import atexit
+import binascii
 import json
 import os
+import re
+
+# shutil and subprocess are only needed to copy to the clipboard, but asyncio and
+# Textual import both before this module loads, so deferring them saves nothing.
 import shutil
 import subprocess
 import sys
-from asyncio import Lock
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable
 
 from textual import events, on
 from textual.app import ComposeResult
@@ -15,123 +21,269 @@ from textual.binding import Binding
 from textual.containers import Horizontal
 from textual.dom import NoScreen
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Label
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - optional speedup
+    pybase64 = None  # type: ignore[assignment]
+
+# pybase64's C extension runs the SIMD (SSSE3/AVX2/NEON) kernels of aklomp/base64;
+# without the extension it falls back to the stdlib encoder itself.
+if pybase64 is not None:
+    _b64encode = pybase64.b64encode
+else:
+    from base64 import b64encode as _b64encode
+
+# orjson silently coerces integers beyond 64 bits to floats; lines containing
+# long digit runs are left to the stdlib parser so no precision is lost.
+_LONG_DIGITS = re.compile(r"\d{19,}")
+
+
+# subprocess.CREATE_NO_WINDOW, which only exists on Windows builds of Python
+_CREATE_NO_WINDOW = 0x08000000
+
+ClipboardWriter = Callable[[bytes], "tuple[bool, str | None]"]
+
+# shutil.which results keyed by (tool, PATH); each lookup stats every PATH entry
+_WHICH_CACHE: dict[tuple[str, str], str | None] = {}
+
+
+def _which(name: str) -> str | None:
+    """Return `shutil.which(name)`, memoized for the current PATH."""
+    key = (name, os.environ.get("PATH", ""))
+    try:
+        return _WHICH_CACHE[key]
+    except KeyError:
+        path = _WHICH_CACHE[key] = shutil.which(name)
+        return path
+
+
+def _tool_writer(argv: list[str], encoding: str = "utf-8", **run_kwargs: Any) -> ClipboardWriter:
+    """Return a writer that pipes the payload to a clipboard utility.
+
+    The payload arrives UTF-8 encoded and is re-encoded if the tool expects
+    another `encoding`.
+    """
+
+    def write(data: bytes) -> tuple[bool, str | None]:
+        if encoding != "utf-8":
+            data = data.decode("utf-8").encode(encoding)
+        subprocess.run(argv, input=data, check=True, **run_kwargs)
+        return True, None
+
+    return write
+
+
+def _osc52_writer(fallback: ClipboardWriter | None) -> ClipboardWriter:
+    """Return a writer using OSC 52, deferring to `fallback` if that fails."""
+
+    def write(data: bytes) -> tuple[bool, str | None]:
+        env_max = os.getenv("TAILJLOGS_OSC52_MAX_BYTES")
+        osc_max = _OSC52_DEFAULT_MAX if env_max is None else int(env_max)
+        try:
+            ok, err = _send_osc52(data, max_bytes=osc_max)
+        except Exception as exc:
+            ok, err = False, str(exc)
+        if ok:
+            return True, None
+        if fallback is None:
+            return False, err or "OSC52 failed"
+        return fallback(data)
+
+    return write
+
+
+# Hidden Tkinter window kept for the rest of the session once the Tk backend is used
+_tk_root: Any = None
+
 
-def _copy_to_clipboard(text: str) -> tuple[bool, str | None]:
-    """Copy text to the system clipboard using platform utilities.
+def _tk_writer() -> ClipboardWriter:
+    """Return a writer using a hidden Tkinter window (last resort).
 
-    Tries macOS `pbcopy`, Wayland `wl-copy`, X11 `xclip`/`xsel`, then falls back to
-    Tkinter if available. Returns (True, None) on success or (False, error_message).
+    The window is created on the first copy and reused, as connecting to the
+    display for every copy is slow.
     """
     try:
-        method = os.getenv("TAILJLOGS_COPY_METHOD", "auto").lower()
-        # Use system clipboard utilities unless osc52 is explicitly requested
-        if method != "osc52":
-            # macOS
-            if sys.platform == "darwin":
-                subprocess.run(["pbcopy"], input=text.encode("utf-8"), check=True)
-                return True, None
-
-            # Windows
-            if sys.platform.startswith("win"):
-                subprocess.run("clip", input=text.encode("utf-8"), check=True, shell=True)
-                return True, None
-
-            # Linux / BSD - try common clipboard tools
-            if shutil.which("wl-copy"):
-                subprocess.run(["wl-copy"], input=text.encode("utf-8"), check=True)
-                return True, None
-            if shutil.which("xclip"):
-                subprocess.run(
-                    ["xclip", "-selection", "clipboard"], input=text.encode("utf-8"), check=True
-                )
-                return True, None
-            if shutil.which("xsel"):
-                subprocess.run(
-                    ["xsel", "--clipboard", "--input"], input=text.encode("utf-8"), check=True
-                )
-                return True, None
+        import tkinter as _tk
+    except Exception as exc:  # pragma: no cover - environment dependent
+        error = f"No clipboard utility found: {exc}"
+        return lambda data: (False, error)
 
-        # Try terminal OSC 52 (useful for SSH/headless terminals)
-        method = os.getenv("TAILJLOGS_COPY_METHOD", "auto").lower()
-        osc_max = int(os.getenv("TAILJLOGS_OSC52_MAX_BYTES", "65536"))
-        if method in ("osc52", "auto"):
-            # prefer osc52 when DISPLAY is not set or when explicitly requested
-            try:
-                ok, err = _send_osc52(text, max_bytes=osc_max)
-                if ok:
-                    return True, None
-                if method == "osc52":
-                    return False, err or "OSC52 failed"
-            except Exception as exc:
-                if method == "osc52":
-                    return False, str(exc)
-                # else continue to Tkinter fallback
-
-        # Final fallback: Tkinter if available
+    def write(data: bytes) -> tuple[bool, str | None]:
+        global _tk_root
         try:
-            import tkinter as _tk
-
-            root = _tk.Tk()
-            root.withdraw()
-            root.clipboard_clear()
-            root.clipboard_append(text)
-            root.update()
-            root.destroy()
+            if _tk_root is None:
+                _tk_root = _tk.Tk()
+                _tk_root.withdraw()
+                atexit.register(_tk_root.destroy)
+            _tk_root.clipboard_clear()
+            _tk_root.clipboard_append(data.decode("utf-8"))
+            _tk_root.update()
             return True, None
         except Exception as exc:  # pragma: no cover - environment dependent
             return False, f"No clipboard utility found: {exc}"
-    except Exception as exc:  # pragma: no cover - runtime error
-        return False, str(exc)
 
+    return write
+
+
+# Clipboard utilities in order of preference: (availability probe, argv, writer options)
+_CLIPBOARD_TOOLS: tuple[tuple[Callable[[], bool], list[str], dict[str, Any]], ...] = (
+    (lambda: sys.platform == "darwin", ["pbcopy"], {}),
+    # Run clip.exe directly rather than via cmd.exe, without a console flash.
+    # It reads UTF-16LE; UTF-8 input garbles non-ASCII text.
+    (
+        lambda: sys.platform.startswith("win"),
+        ["clip.exe"],
+        {"encoding": "utf-16-le", "creationflags": _CREATE_NO_WINDOW},
+    ),
+    (lambda: _which("wl-copy") is not None, ["wl-copy"], {}),
+    (lambda: _which("xclip") is not None, ["xclip", "-selection", "clipboard"], {}),
+    (lambda: _which("xsel") is not None, ["xsel", "--clipboard", "--input"], {}),
+)
 
-def _send_osc52(text: str, max_bytes: int = 65536) -> tuple[bool, str | None]:
-    """Send text to the local terminal clipboard using OSC 52 escape sequence.
 
-    Encodes `text` as UTF-8 then base64 and writes the OSC 52 sequence to stdout.
-    Returns (True, None) on success, or (False, error_message) on failure.
+@lru_cache(maxsize=1)
+def _resolve_clipboard_backend(method: str) -> ClipboardWriter:
+    """Pick the clipboard writer for a copy method, probing the platform only once.
+
+    System utilities are used unless `method` is "osc52": macOS `pbcopy`, Windows
+    `clip.exe`, then Wayland `wl-copy` and X11 `xclip`/`xsel`. Without one, "auto" and
+    "osc52" use the OSC 52 escape sequence, and everything else ends at Tkinter.
     """
+    if method != "osc52":
+        for available, argv, options in _CLIPBOARD_TOOLS:
+            if available():
+                return _tool_writer(argv, **options)
+
+    if method == "osc52":
+        return _osc52_writer(None)
+    if method == "auto":
+        return _osc52_writer(_tk_writer())
+    return _tk_writer()
+
+
+def _copy_to_clipboard(text: str | bytes) -> tuple[bool, str | None]:
+    """Copy text to the system clipboard.
+
+    The backend is chosen once per copy method (`TAILJLOGS_COPY_METHOD`) by
+    `_resolve_clipboard_backend`. `text` may be given already UTF-8 encoded.
+    Returns (True, None) on success or (False, error_message).
+    """
+    data = text.encode("utf-8") if isinstance(text, str) else text
+    method = os.getenv("TAILJLOGS_COPY_METHOD", "auto").lower()
     try:
-        data = text.encode("utf-8")
-    except Exception as exc:
+        return _resolve_clipboard_backend(method)(data)
+    except Exception as exc:  # pragma: no cover - runtime error
         return False, str(exc)
 
-    if len(data) > max_bytes:
-        return False, f"OSC52 payload too large ({len(data)} > {max_bytes} bytes)"
 
-    b64 = base64.b64encode(data).decode("ascii")
-    seq = f"\x1b]52;c;{b64}\a"
+_OSC52_PREFIX = b"\x1b]52;c;"
+_OSC52_SUFFIX = b"\a"
+_OSC52_FRAME_LEN = len(_OSC52_PREFIX) + len(_OSC52_SUFFIX)
+_OSC52_DEFAULT_MAX = 65536
+# Base64 budget under the default limit, the one nearly every copy uses
+_OSC52_ENC_LIMIT = _OSC52_DEFAULT_MAX - _OSC52_FRAME_LEN
+_ERR_TOO_LARGE = f"OSC52 payload too large (over {_OSC52_DEFAULT_MAX} bytes)"
+# Up to this size binascii beats pybase64, whose SIMD dispatch costs more than
+# it saves on a handful of bytes
+_OSC52_SMALL_PAYLOAD = 48
+
+
+def _send_osc52(text: str | bytes, max_bytes: int = _OSC52_DEFAULT_MAX) -> tuple[bool, str | None]:
+    """Send text to the local terminal clipboard using OSC 52 escape sequence.
+
+    Encodes `text` as UTF-8 (unless given as bytes already) then base64 and writes
+    the OSC 52 sequence to stdout.
+    `max_bytes` limits the length of the whole escape sequence, which is what
+    terminals cap. Returns (True, None) on success, or (False, error_message) on
+    failure.
+    """
+    if isinstance(text, (bytes, bytearray)):
+        data = text
+    else:
+        try:
+            data = text.encode("utf-8")
+        except Exception as exc:
+            return False, str(exc)
+
+    # Size the sequence from the base64 length so oversized payloads are
+    # rejected without being encoded
+    enc_len = (len(data) + 2) // 3 * 4
+    if max_bytes == _OSC52_DEFAULT_MAX:
+        if enc_len > _OSC52_ENC_LIMIT:
+            return False, _ERR_TOO_LARGE
+    elif enc_len > max_bytes - _OSC52_FRAME_LEN:
+        seq_len = enc_len + _OSC52_FRAME_LEN
+        return False, f"OSC52 payload too large ({seq_len} > {max_bytes} bytes)"
+
+    # join() sizes the result up front, so the sequence is built in a single
+    # allocation and goes out in one write() whichever stream receives it
+    if len(data) <= _OSC52_SMALL_PAYLOAD:
+        b64 = binascii.b2a_base64(data, newline=False)
+    else:
+        b64 = _b64encode(data)
+    seq = b"".join((_OSC52_PREFIX, b64, _OSC52_SUFFIX))
     try:
-        # Write to stdout so the terminal can receive the OSC 52 sequence
-        sys.stdout.write(seq)
+        # Write to stdout so the terminal can receive the OSC 52 sequence. While
+        # the app runs, Textual swaps sys.stdout for a capture object with no
+        # .buffer, so copies take the text branch; the binary buffer is only
+        # there when stdout is a real stream, as outside the app.
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            sys.stdout.flush()  # keep ordering with text already written
+            buffer.write(seq)
+        else:
+            sys.stdout.write(seq.decode("ascii"))
         sys.stdout.flush()
         return True, None
     except Exception as exc:
         return False, str(exc)
 
 
-def _format_line_for_copy(line: str, raw: bool = False) -> str:
-    """Return the string that should be copied for the given line.
+def _pretty_json(data: Any) -> bytes:
+    """Serialize parsed JSON with two-space indentation as UTF-8, keeping non-ASCII text."""
+    # Freshly parsed JSON cannot contain reference cycles, so skip the encoder's
+    # per-container cycle bookkeeping.
+    text = json.dumps(data, indent=2, ensure_ascii=False, check_circular=False)
+    # A lone surrogate escape such as "\ud83d" is valid JSON but not encodable
+    # as UTF-8; backslashreplace writes it back out as the same JSON escape.
+    return text.encode("utf-8", "backslashreplace")
+
 
-    - If raw is True, returns the original line unchanged.
-    - If raw is False, attempts to parse and pretty-print JSON; raises ValueError
-      if parsing fails.
+def _pretty_json_line(line: str) -> bytes:
+    """Parse a JSON line and return it pretty-printed as UTF-8 bytes.
+
+    The bytes can go straight to the clipboard; raises ValueError if the line is
+    not valid JSON.
     """
-    if raw:
-        return line
+    if orjson is not None and _LONG_DIGITS.search(line) is None:
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Fall through to the stdlib parser, which also accepts NaN/Infinity
+            pass
+        else:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
 
     try:
         data = json.loads(line)
     except Exception as exc:  # pragma: no cover - parsing error handled by caller
         raise ValueError("Not valid JSON") from exc
 
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    return _pretty_json(data)
 
 
 from tailjlogs.find_dialog import FilterDialog, FindDialog
 from tailjlogs.line_panel import LinePanel
+from tailjlogs.log_file import LogFile
 from tailjlogs.log_lines import LogLines
 from tailjlogs.messages import (
     DismissOverlay,
@@ -149,6 +301,32 @@ SPLIT_REGEX = r"[\s/\[\]]"
 
 MAX_DETAIL_LINE_LENGTH = 100_000
 
+# Seconds over which bursts of overlay updates are coalesced into a single write
+COALESCE_INTERVAL = 0.05
+
+
+# Modifier attributes exposed by the installed Textual's key events, probed once.
+# Current releases expose none and fold modifiers into the key name ("ctrl+k").
+_MOD_ATTRS = tuple(m for m in ("ctrl", "shift", "meta", "alt") if hasattr(events.Key, m))
+# Some Textual versions provide a 'modifiers' tuple
+_HAS_MODIFIERS_TUPLE = hasattr(events.Key, "modifiers")
+
+
+def _describe_key_event(event: events.Key) -> str:
+    """Return the KeyDebug overlay text for a key event."""
+    # Try common attributes for key and modifiers; be defensive.
+    key = (
+        getattr(event, "key", None)
+        or getattr(event, "character", None)
+        or getattr(event, "key_name", None)
+        or str(event)
+    )
+    mods = [m for m in _MOD_ATTRS if getattr(event, m)]
+    if _HAS_MODIFIERS_TUPLE:
+        mods.extend([str(x) for x in event.modifiers])
+    mod_text = ",".join(mods) if mods else "none"
+    return f"Key: {key} | Mods: {mod_text}"
+
 
 class KeyDebug(Widget):
     """Temporary overlay to display the last key event received (for debugging).
@@ -156,6 +334,8 @@ class KeyDebug(Widget):
     Shows the last key event and auto-hides after `hide_timeout` seconds of
     inactivity (default 3s)."""
 
+    __slots__ = ("_hide_timer",)
+
     DEFAULT_CSS = """
     KeyDebug {
         display: none;
@@ -239,6 +419,8 @@ class KeyDebug(Widget):
 class InfoOverlay(Widget):
     """Displays text under the lines widget when there are new lines."""
 
+    __slots__ = ()
+
     DEFAULT_CSS = """
     InfoOverlay {
         display: none;
@@ -295,6 +477,8 @@ class InfoOverlay(Widget):
 class FooterKey(Label):
     """Displays a clickable label for a key."""
 
+    __slots__ = ("key", "key_display", "description", "action", "_rendered")
+
     DEFAULT_CSS = """
     FooterKey {
         color: $success;
@@ -314,16 +498,19 @@ class FooterKey(Label):
         self.key_display = key_display
         self.description = description
         self.action = action
+        self._rendered = f"[reverse]{key_display}[/reverse] {description}"
         super().__init__()
 
     def render(self) -> str:
-        return f"[reverse]{self.key_display}[/reverse] {self.description}"
+        return self._rendered
 
     async def on_click(self) -> None:
         await self.app.run_action(self.action)
 
 
 class MetaLabel(Label):
+    __slots__ = ()
+
     DEFAULT_CSS = """
     MetaLabel {
         margin-left: 1;
@@ -340,6 +527,16 @@ class MetaLabel(Label):
 class LogFooter(Widget):
     """Shows a footer with information about the file and keys."""
 
+    __slots__ = (
+        "_mounting_keys",
+        "_keys_dirty",
+        "_last_bindings_key",
+        "_meta_label",
+        "_last_meta_key",
+        "_last_timestamp",
+        "_timestamp_text",
+    )
+
     DEFAULT_CSS = """
     LogFooter {
         layout: horizontal;
@@ -386,7 +583,13 @@ class LogFooter(Widget):
     show_panel: reactive[bool] = reactive(False)
 
     def __init__(self) -> None:
-        self.lock = Lock()
+        self._mounting_keys = False
+        self._keys_dirty = False
+        self._last_bindings_key: tuple[tuple[str, str | None, str, str], ...] | None = None
+        self._meta_label: Label | None = None
+        self._last_meta_key: tuple[str, datetime | None, int | None, bool, bool] | None = None
+        self._last_timestamp: datetime | None = None
+        self._timestamp_text = ""
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -401,41 +604,72 @@ class LogFooter(Widget):
                 return
         except NoScreen:
             pass
-        async with self.lock:
-            with self.app.batch_update():
-                key_container = self.query_one(".key-container")
-                await key_container.query("*").remove()
+        # Latest wins: a call made while keys are being mounted only marks them
+        # dirty, and the call in flight rebuilds once more instead of queueing.
+        self._keys_dirty = True
+        if self._mounting_keys:
+            return
+        self._mounting_keys = True
+        try:
+            while self._keys_dirty:
+                self._keys_dirty = False
                 bindings = [
                     active_binding.binding
                     for active_binding in self.app.active_bindings.values()
                     if active_binding.binding.show
+                    and (active_binding.binding.action != "toggle_tail" or self.can_tail)
                 ]
-
-                await key_container.mount_all(
-                    [
-                        FooterKey(
-                            binding.key,
-                            binding.key_display or binding.key,
-                            binding.description,
-                            binding.action,
-                        )
-                        for binding in bindings
-                        if binding.action != "toggle_tail"
-                        or (binding.action == "toggle_tail" and self.can_tail)
-                    ]
+                # Focus changes often leave the visible bindings as they were
+                bindings_key = tuple(
+                    (binding.key, binding.key_display, binding.description, binding.action)
+                    for binding in bindings
                 )
+                if bindings_key == self._last_bindings_key:
+                    continue
+                self._last_bindings_key = bindings_key
+
+                with self.app.batch_update():
+                    key_container = self.query_one(".key-container")
+                    await key_container.query("*").remove()
+                    await key_container.mount_all(
+                        [
+                            FooterKey(
+                                binding.key,
+                                binding.key_display or binding.key,
+                                binding.description,
+                                binding.action,
+                            )
+                            for binding in bindings
+                        ]
+                    )
+        finally:
+            self._mounting_keys = False
 
     async def on_mount(self):
+        self._meta_label = self.query_one(".meta", Label)
+        self.update_meta()
         self.watch(self.screen, "focused", self.mount_keys)
         self.watch(self.screen, "stack_updates", self.mount_keys)
         self.call_after_refresh(self.mount_keys)
 
     def update_meta(self) -> None:
+        # Be defensive if widget not fully mounted
+        if self._meta_label is None:
+            return
+        # Watchers fire for each field; rebuild only when something shown changed
+        meta_key = (self.filename, self.timestamp, self.line_no, self.show_panel, self.copy_raw)
+        if meta_key == self._last_meta_key:
+            return
+        self._last_meta_key = meta_key
+
         meta: list[str] = []
         if self.filename:
             meta.append(self.filename)
         if self.timestamp is not None:
-            meta.append(f"{self.timestamp:%x %X}")
+            if self.timestamp != self._last_timestamp:
+                self._last_timestamp = self.timestamp
+                self._timestamp_text = self.timestamp.strftime("%x %X")
+            meta.append(self._timestamp_text)
         if self.line_no is not None:
             meta.append(f"{self.line_no + 1}")
 
@@ -443,12 +677,7 @@ class LogFooter(Widget):
         if self.show_panel:
             meta.append(f"Copy: {'Raw' if self.copy_raw else 'Pretty'}")
 
-        meta_line = " • ".join(meta)
-        # Be defensive if widget not fully mounted
-        try:
-            self.query_one(".meta", Label).update(meta_line)
-        except Exception:
-            pass
+        self._meta_label.update(" • ".join(meta))
 
     def watch_tail(self, tail: bool) -> None:
         self.query(".tail").set_class(tail and self.can_tail, "on")
@@ -465,10 +694,37 @@ class LogFooter(Widget):
     def watch_timestamp(self, timestamp: datetime | None) -> None:
         self.update_meta()
 
+    def watch_copy_raw(self, copy_raw: bool) -> None:
+        self.update_meta()
+
+    def watch_show_panel(self, show_panel: bool) -> None:
+        self.update_meta()
+
 
 class LogView(Horizontal):
     """Widget that contains log lines and associated widgets."""
 
+    __slots__ = (
+        "file_paths",
+        "watcher",
+        "max_lines",
+        "min_level",
+        "_copy_cache",
+        "_last_panel_fetch",
+        "_pending_key_event",
+        "_key_flush_timer",
+        "_pending_count",
+        "_pending_flush_timer",
+        "_scan_progress",
+        "_scan_flush_timer",
+        "_log_lines",
+        "_line_panel",
+        "_info",
+        "_footer",
+        "_key_debug",
+        "_scan_progress_bar",
+    )
+
     DEFAULT_CSS = """
     LogView {
         &.show-panel {
@@ -526,6 +782,19 @@ class LogView(Horizontal):
         self.watcher = watcher
         self.max_lines = max_lines
         self.min_level = min_level
+        # Last copy payload as ((log_file, start, end), copy_raw, UTF-8 bytes). Keyed
+        # on the span, as lines tailed into a merged view can shift display indices.
+        self._copy_cache: tuple[tuple[LogFile, int, int], bool, bytes] | None = None
+        # Raw line last shown in the detail panel as ((log_file, start, end), line)
+        self._last_panel_fetch: tuple[tuple[LogFile, int, int], str] | None = None
+        # Latest key event, flushed to KeyDebug at most once per interval
+        self._pending_key_event: events.Key | None = None
+        self._key_flush_timer: Timer | None = None
+        # Latest pending-line count and scan progress, applied once per interval
+        self._pending_count: int | None = None
+        self._pending_flush_timer: Timer | None = None
+        self._scan_progress: tuple[str, float] | None = None
+        self._scan_flush_timer: Timer | None = None
         super().__init__()
         self.can_tail = can_tail
 
@@ -550,6 +819,15 @@ class LogView(Horizontal):
         # Key debug overlay (toggleable)
         yield KeyDebug().data_bind(LogView.show_key_debug)
 
+    def on_mount(self) -> None:
+        # Resolve children once; the message handlers below run many times a second
+        self._log_lines = self.query_one(LogLines)
+        self._line_panel = self.query_one(LinePanel)
+        self._info = self.query_one(InfoOverlay)
+        self._footer = self.query_one(LogFooter)
+        self._key_debug = self.query_one(KeyDebug)
+        self._scan_progress_bar = self.query_one(ScanProgressBar)
+
     @on(FindDialog.Update)
     def find_dialog_update(self, event: FindDialog.Update) -> None:
         log_lines = self.query_one(LogLines)
@@ -634,15 +912,17 @@ class LogView(Horizontal):
     async def update_panel(self) -> None:
         if not self.show_panel:
             return
-        pointer_line = self.query_one(LogLines).pointer_line
+        log_lines = self._log_lines
+        pointer_line = log_lines.pointer_line
         if pointer_line is not None:
-            line, text, timestamp = self.query_one(LogLines).get_text(
+            line, text, timestamp = log_lines.get_text(
                 pointer_line,
                 block=True,
                 abbreviate=True,
                 max_line_length=MAX_DETAIL_LINE_LENGTH,
             )
-            await self.query_one(LinePanel).update(line, text, timestamp)
+            self._last_panel_fetch = (log_lines.index_to_span(pointer_line), line)
+            await self._line_panel.update(line, text, timestamp)
 
     @on(PointerMoved)
     async def pointer_moved(self, event: PointerMoved):
@@ -651,12 +931,12 @@ class LogView(Horizontal):
         if self.show_panel:
             await self.update_panel()
 
-        log_lines = self.query_one(LogLines)
+        log_lines = self._log_lines
         pointer_line = (
             log_lines.scroll_offset.y if event.pointer_line is None else event.pointer_line
         )
         log_file, _, _ = log_lines.index_to_span(pointer_line)
-        log_footer = self.query_one(LogFooter)
+        log_footer = self._footer
         log_footer.line_no = pointer_line
         if len(log_lines.log_files) > 1:
             log_footer.filename = log_file.name
@@ -669,25 +949,51 @@ class LogView(Horizontal):
         if self.app._exit:
             return
         event.stop()
-        self.query_one(InfoOverlay).message = f"+{event.count:,} lines"
+        # The count is a running total, so only the latest one needs showing
+        self._pending_count = event.count
+        if self._pending_flush_timer is None:
+            self._pending_flush_timer = self.set_timer(COALESCE_INTERVAL, self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        self._pending_flush_timer = None
+        count = self._pending_count
+        self._pending_count = None
+        # Tailing again clears the overlay; don't bring back a stale count
+        if count is None or self.tail:
+            return
+        self._info.message = f"+{count:,} lines"
 
     @on(ScanProgress)
     def on_scan_progress(self, event: ScanProgress):
         event.stop()
-        scan_progress_bar = self.query_one(ScanProgressBar)
-        scan_progress_bar.message = event.message
-        scan_progress_bar.complete = event.complete
+        self._scan_progress = (event.message, event.complete)
+        if self._scan_flush_timer is None:
+            self._scan_flush_timer = self.set_timer(COALESCE_INTERVAL, self._flush_scan_progress)
+
+    def _flush_scan_progress(self) -> None:
+        self._scan_flush_timer = None
+        if self._scan_progress is None:
+            return
+        message, complete = self._scan_progress
+        self._scan_progress = None
+        scan_progress_bar = self._scan_progress_bar
+        scan_progress_bar.message = message
+        scan_progress_bar.complete = complete
 
     @on(ScanComplete)
     async def on_scan_complete(self, event: ScanComplete) -> None:
-        self.query_one(ScanProgressBar).remove()
-        log_lines = self.query_one(LogLines)
+        if self._scan_flush_timer is not None:
+            self._scan_flush_timer.stop()
+            self._scan_flush_timer = None
+        self._scan_progress = None
+        self._scan_progress_bar.remove()
+        log_lines = self._log_lines
         log_lines.loading = False
-        self.query_one("LogLines").remove_class("-scanning")
+        log_lines.remove_class("-scanning")
         self.post_message(PointerMoved(log_lines.pointer_line))
         self.tail = True
 
-        footer = self.query_one(LogFooter)
+        footer = self._footer
         footer.call_after_refresh(footer.mount_keys)
 
     @on(events.DescendantFocus)
@@ -712,32 +1018,26 @@ class LogView(Horizontal):
         # Do not stop event propagation; this is purely observational.
         if not self.show_key_debug:
             return
-        # Try common attributes for key and modifiers; be defensive.
-        key = (
-            getattr(event, "key", None)
-            or getattr(event, "character", None)
-            or getattr(event, "key_name", None)
-            or str(event)
-        )
-        mods: list[str] = []
-        for m in ("ctrl", "shift", "meta", "alt"):
-            try:
-                if getattr(event, m, False):
-                    mods.append(m)
-            except Exception:
-                pass
-        # Some Textual versions provide a 'modifiers' tuple
-        if hasattr(event, "modifiers"):
-            try:
-                mods.extend([str(x) for x in event.modifiers])
-            except Exception:
-                pass
-        mod_text = ",".join(mods) if mods else "none"
-        message = f"Key: {key} | Mods: {mod_text}"
-        try:
-            self.query_one(KeyDebug).message = message
-        except Exception:
-            pass
+        # Only keep the event; it is described when the overlay next refreshes
+        self._pending_key_event = event
+        # Coalesce key-repeat bursts into one overlay update per interval
+        if self._key_flush_timer is None:
+            self._key_flush_timer = self.set_interval(COALESCE_INTERVAL, self._flush_key_msg)
+
+    def _flush_key_msg(self) -> None:
+        event = self._pending_key_event
+        if event is None:
+            # No keys since the last flush; stop polling until the next key
+            if self._key_flush_timer is not None:
+                self._key_flush_timer.stop()
+                self._key_flush_timer = None
+            return
+        self._pending_key_event = None
+        if not self.show_key_debug:
+            return
+        message = _describe_key_event(event)
+        if self._key_debug.message != message:
+            self._key_debug.message = message
 
     def action_show_find_dialog(self) -> None:
         find_dialog = self.query_one(FindDialog)
@@ -773,27 +1073,47 @@ class LogView(Horizontal):
             self.notify("Open the line panel (Enter) to view/copy JSON", title="Copy")
             return
 
-        log_lines = self.query_one(LogLines)
+        log_lines = self._log_lines
         pointer_line = log_lines.pointer_line
         if pointer_line is None:
             self.notify("No line selected", title="Copy", severity="error")
             return
 
-        line, _text, _timestamp = log_lines.get_text(pointer_line, block=True, abbreviate=False)
-
-        try:
-            out = _format_line_for_copy(line, raw=self.copy_raw)
-        except ValueError:
-            self.notify("Current line is not valid JSON", title="Copy", severity="error")
-            return
+        copy_raw = self.copy_raw
+        span = log_lines.index_to_span(pointer_line)
+        cache = self._copy_cache
+        if cache is not None and cache[0] == span and cache[1] == copy_raw:
+            out = cache[2]
+        else:
+            line = self._line_for_copy(pointer_line, span)
+            if copy_raw:
+                out = line.encode("utf-8")
+            else:
+                try:
+                    out = _pretty_json_line(line)
+                except ValueError:
+                    self.notify("Current line is not valid JSON", title="Copy", severity="error")
+                    return
+            self._copy_cache = (span, copy_raw, out)
 
         ok, err = _copy_to_clipboard(out)
         if ok:
-            fmt = "Raw" if self.copy_raw else "Pretty"
+            fmt = "Raw" if copy_raw else "Pretty"
             self.notify(f"Copied {fmt} JSON to clipboard", title="Copy")
         else:
             self.notify(f"Copy failed: {err}", title="Copy", severity="error")
 
+    def _line_for_copy(self, pointer_line: int, span: tuple[LogFile, int, int]) -> str:
+        """Return the full line at `pointer_line`, reusing the panel's fetch of `span`."""
+        panel_fetch = self._last_panel_fetch
+        if panel_fetch is not None and panel_fetch[0] == span:
+            # Abbreviation only shortens the panel's rendered text, not the raw line
+            return panel_fetch[1]
+        line, _text, _timestamp = self._log_lines.get_text(
+            pointer_line, block=True, abbreviate=False
+        )
+        return line
+
     def action_toggle_copy_format(self) -> None:
         """Toggle between pretty-printed and raw JSON when copying."""
         self.copy_raw = not self.copy_raw
@@ -1,3 +1,4 @@
+import json
 import sys
 import types
 from unittest.mock import Mock
@@ -7,6 +8,17 @@ import pytest
 from tailjlogs import log_view
 
 
+@pytest.fixture(autouse=True)
+def reset_clipboard_backend(monkeypatch):
+    # The resolved clipboard backend, tool lookups and Tk window are cached per
+    # process; start afresh in each test
+    monkeypatch.setattr(log_view, "_tk_root", None)
+    monkeypatch.setattr(log_view, "_WHICH_CACHE", {})
+    log_view._resolve_clipboard_backend.cache_clear()
+    yield
+    log_view._resolve_clipboard_backend.cache_clear()
+
+
 def test_copy_uses_pbcopy_on_macos(monkeypatch):
     monkeypatch.setattr(sys, "platform", "darwin")
 
@@ -23,6 +35,24 @@ def test_copy_uses_pbcopy_on_macos(monkeypatch):
     assert err is None
 
 
+def test_copy_uses_clip_exe_on_windows(monkeypatch):
+    monkeypatch.setattr(sys, "platform", "win32")
+
+    mock_run = Mock()
+    monkeypatch.setattr(log_view, "subprocess", types.SimpleNamespace(run=mock_run))
+
+    ok, err = log_view._copy_to_clipboard("héllo")
+
+    mock_run.assert_called_once()
+    args, kwargs = mock_run.call_args
+    assert args[0] == ["clip.exe"]
+    assert kwargs.get("input") == "héllo".encode("utf-16-le")
+    assert kwargs.get("creationflags") == log_view._CREATE_NO_WINDOW
+    assert "shell" not in kwargs
+    assert ok is True
+    assert err is None
+
+
 def test_copy_uses_wl_copy_when_present(monkeypatch):
     monkeypatch.setattr(sys, "platform", "linux")
 
@@ -47,6 +77,45 @@ def test_copy_uses_wl_copy_when_present(monkeypatch):
     assert err is None
 
 
+def test_copy_probes_clipboard_tool_once(monkeypatch):
+    monkeypatch.setattr(sys, "platform", "linux")
+
+    probes = []
+
+    def which(name):
+        probes.append(name)
+        return "/usr/bin/xclip" if name == "xclip" else None
+
+    monkeypatch.setattr(log_view, "shutil", types.SimpleNamespace(which=which))
+    mock_run = Mock()
+    monkeypatch.setattr(log_view, "subprocess", types.SimpleNamespace(run=mock_run))
+
+    assert log_view._copy_to_clipboard("one") == (True, None)
+    assert log_view._copy_to_clipboard(b"two") == (True, None)
+
+    assert probes == ["wl-copy", "xclip"]
+    assert mock_run.call_args_list[0].args[0] == ["xclip", "-selection", "clipboard"]
+    assert mock_run.call_args_list[1].kwargs.get("input") == b"two"
+
+
+def test_which_is_memoized_per_path(monkeypatch):
+    calls = []
+
+    def which(name):
+        calls.append(name)
+        return f"/usr/bin/{name}"
+
+    monkeypatch.setattr(log_view, "shutil", types.SimpleNamespace(which=which))
+    monkeypatch.setenv("PATH", "/usr/bin")
+    assert log_view._which("xclip") == "/usr/bin/xclip"
+    assert log_view._which("xclip") == "/usr/bin/xclip"
+    assert calls == ["xclip"]
+
+    monkeypatch.setenv("PATH", "/usr/local/bin:/usr/bin")
+    log_view._which("xclip")
+    assert calls == ["xclip", "xclip"]
+
+
 def test_copy_falls_back_to_tkinter(monkeypatch):
     monkeypatch.setattr(sys, "platform", "linux")
 
@@ -81,16 +150,75 @@ def test_copy_falls_back_to_tkinter(monkeypatch):
     assert err is None
 
 
-def test_format_line_for_copy_pretty_and_raw():
-    line = '{"a":1,"b":"text"}'
-    pretty = log_view._format_line_for_copy(line, raw=False)
-    assert pretty.startswith('{\n  "a": 1,')
-    raw = log_view._format_line_for_copy(line, raw=True)
-    assert raw == line
+def test_copy_reuses_tk_root(monkeypatch):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("TAILJLOGS_COPY_METHOD", "tk")
+    monkeypatch.setattr(log_view, "shutil", types.SimpleNamespace(which=lambda name: None))
+    monkeypatch.setattr(log_view, "atexit", types.SimpleNamespace(register=lambda fn: fn))
+
+    fake_module = Mock()
+    tk_root = fake_module.Tk.return_value
+    monkeypatch.setitem(sys.modules, "tkinter", fake_module)
 
+    assert log_view._copy_to_clipboard("one") == (True, None)
+    assert log_view._copy_to_clipboard("two") == (True, None)
 
-def test_format_line_for_copy_invalid_raises():
+    fake_module.Tk.assert_called_once()
+    tk_root.clipboard_append.assert_called_with("two")
+    tk_root.destroy.assert_not_called()
+
+
+def test_pretty_json_line_indents():
+    pretty = log_view._pretty_json_line('{"a":1,"b":"text"}')
+    assert pretty.startswith(b'{\n  "a": 1,')
+
+
+def test_pretty_json_line_invalid_raises():
     bad = "not a json"
 
     with pytest.raises(ValueError):
-        log_view._format_line_for_copy(bad, raw=False)
+        log_view._pretty_json_line(bad)
+
+
+def test_pretty_json_line_without_orjson(monkeypatch):
+    monkeypatch.setattr(log_view, "orjson", None)
+    pretty = log_view._pretty_json_line('{"a":1,"b":"tëxt"}')
+    assert pretty == '{\n  "a": 1,\n  "b": "tëxt"\n}'.encode("utf-8")
+
+
+def test_pretty_json_line_keeps_big_ints():
+    line = '{"id": 123456789012345678901234567890}'
+    pretty = log_view._pretty_json_line(line)
+    assert b"123456789012345678901234567890" in pretty
+
+
+def test_pretty_json_line_matches_stdlib_output():
+    line = '{"a":[1,2.5,{"b":null}],"c":"é ✓","d":{},"e":[]}'
+    pretty = log_view._pretty_json_line(line)
+    assert pretty == json.dumps(json.loads(line), indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def test_pretty_json_line_returns_utf8_bytes():
+    assert log_view._pretty_json_line('{"a":"é"}') == '{\n  "a": "é"\n}'.encode("utf-8")
+
+
+def test_pretty_json_line_keeps_lone_surrogate_escape():
+    pretty = log_view._pretty_json_line('{"m":"\\ud83d"}')
+    assert pretty == b'{\n  "m": "\\ud83d"\n}'
+    assert json.loads(pretty) == {"m": "\ud83d"}
+
+
+def test_line_for_copy_reuses_panel_fetch_only_for_same_span():
+    view = log_view.LogView(["test.jsonl"], watcher=Mock())
+    log_lines = Mock()
+    log_lines.get_text.return_value = ("fetched", None, None)
+    view._log_lines = log_lines
+    log_file = object()
+    view._last_panel_fetch = ((log_file, 0, 10), "from panel")
+
+    assert view._line_for_copy(3, (log_file, 0, 10)) == "from panel"
+    log_lines.get_text.assert_not_called()
+
+    # A line merged in above the pointer leaves a different line at index 3
+    assert view._line_for_copy(3, (log_file, 10, 20)) == "fetched"
+    log_lines.get_text.assert_called_once_with(3, block=True, abbreviate=False)
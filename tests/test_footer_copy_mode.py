@@ -10,3 +10,8 @@ def test_logfooter_has_copy_props():
 def test_keydebug_timeout_default():
     kd = log_view.KeyDebug()
     assert kd.hide_timeout == 3.0
+
+
+def test_footerkey_render_markup():
+    fk = log_view.FooterKey("meta+c", "⌘C", "Copy JSON", "copy_json")
+    assert fk.render() == "[reverse]⌘C[/reverse] Copy JSON"
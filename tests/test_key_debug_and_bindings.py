@@ -29,3 +29,9 @@ def test_keydebug_is_bindable_to_logview():
     # in the app will succeed.
     assert hasattr(log_view.LogView, "show_key_debug")
     assert hasattr(kd, "show_key_debug")
+
+
+def test_describe_key_event():
+    from textual import events
+
+    assert log_view._describe_key_event(events.Key("x", "x")) == "Key: x | Mods: none"
@@ -1,19 +1,42 @@
+import base64
 import sys
+import types
+
+import pytest
 
 from tailjlogs import log_view
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
 
-def test_send_osc52_encodes(monkeypatch):
-    writes = []
+_B64_BACKENDS = {"stdlib": base64.b64encode, "pybase64": pybase64 and pybase64.b64encode}
 
-    class FakeStdout:
-        def write(self, s):
-            writes.append(s)
 
-        def flush(self):
-            pass
+@pytest.mark.parametrize(
+    "backend",
+    [
+        "stdlib",
+        pytest.param(
+            "pybase64",
+            marks=pytest.mark.skipif(pybase64 is None, reason="pybase64 not installed"),
+        ),
+    ],
+)
+def test_send_osc52_encodes(capsysbinary, monkeypatch, backend):
+    monkeypatch.setattr(log_view, "_b64encode", _B64_BACKENDS[backend])
+    ok, err = log_view._send_osc52("Hello", max_bytes=65536)
+    assert ok is True
+    assert err is None
+    assert b"\x1b]52;c;SGVsbG8=\a" in capsysbinary.readouterr().out
+
 
-    monkeypatch.setattr(sys, "stdout", FakeStdout())
+def test_send_osc52_without_stdout_buffer(monkeypatch):
+    # Like Textual's print capture, which stands in for stdout while the app runs
+    writes = []
+    fake = types.SimpleNamespace(write=writes.append, flush=lambda: None)
+    monkeypatch.setattr(sys, "stdout", fake)
 
     ok, err = log_view._send_osc52("Hello", max_bytes=65536)
     assert ok is True
@@ -44,3 +67,26 @@ def test_copy_fallback_to_osc52(monkeypatch):
     ok, err = log_view._copy_to_clipboard('{"a": 1}')
     assert ok is True
     assert "text" in called
+
+
+def test_send_osc52_limit_counts_encoded_sequence(capsysbinary):
+    # "Hello" encodes to 8 base64 chars, plus 8 for the escape prefix and suffix
+    assert log_view._send_osc52("Hello", max_bytes=16) == (True, None)
+    ok, err = log_view._send_osc52("Hello, world", max_bytes=16)
+    assert ok is False
+    assert "too large" in err.lower()
+
+
+def test_send_osc52_accepts_bytes(capsysbinary):
+    assert log_view._send_osc52("héllo".encode("utf-8")) == (True, None)
+    assert log_view._send_osc52("héllo") == (True, None)
+    first, second = capsysbinary.readouterr().out.split(b"\a")[:2]
+    assert first == second
+
+
+def test_send_osc52_small_and_large_payloads_match_stdlib(capsysbinary):
+    data = bytes(range(256)) * 4
+    for size in (1, 48, 49, 1000):
+        assert log_view._send_osc52(data[:size]) == (True, None)
+        seq = capsysbinary.readouterr().out
+        assert seq == b"\x1b]52;c;" + base64.b64encode(data[:size]) + b"\a"